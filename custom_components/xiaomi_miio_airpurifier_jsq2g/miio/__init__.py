@@ -1,5 +1,8 @@
 # flake8: noqa
-from importlib.metadata import version  # type: ignore
+import importlib
+import logging
+import warnings
+from functools import cache
 
 # Library imports need to be on top to avoid problems with
 # circular dependencies. As these do not change that often
@@ -9,113 +12,170 @@ from importlib.metadata import version  # type: ignore
 
 from .device import Device
 from .devicestatus import DeviceStatus
-from .exceptions import (
-    DeviceError,
-    InvalidTokenException,
-    DeviceException,
-    UnsupportedFeatureException,
-    DeviceInfoUnavailableException,
-)
 from .miot_device import MiotDevice
 from .deviceinfo import DeviceInfo
 
 # isort: on
 
-from .cloud import CloudDeviceInfo, CloudException, CloudInterface
-from .descriptorcollection import DescriptorCollection
-from .descriptors import (
-    AccessFlags,
-    ActionDescriptor,
-    Descriptor,
-    EnumDescriptor,
-    PropertyDescriptor,
-    RangeDescriptor,
-    ValidSettingRange,
-)
-from .devicefactory import DeviceFactory
-from .integrations.airdog.airpurifier import AirDogX3
-from .integrations.cgllc.airmonitor import AirQualityMonitor, AirQualityMonitorCGDN1
-from .integrations.chuangmi.camera import ChuangmiCamera
-from .integrations.chuangmi.plug import ChuangmiPlug
-from .integrations.chuangmi.remote import ChuangmiIr
-from .integrations.chunmi.cooker import Cooker
-from .integrations.deerma.humidifier import AirHumidifierJsqs, AirHumidifierMjjsq
-from .integrations.dmaker.airfresh import AirFreshA1, AirFreshT2017
-from .integrations.dmaker.fan import Fan1C, FanMiot, FanP5
-from .integrations.dreame.vacuum import DreameVacuum
-from .integrations.genericmiot.genericmiot import GenericMiot
-from .integrations.huayi.light import (
-    Huizuo,
-    HuizuoLampFan,
-    HuizuoLampHeater,
-    HuizuoLampScene,
-)
-from .integrations.ijai.vacuum import Pro2Vacuum
-from .integrations.ksmb.walkingpad import Walkingpad
-from .integrations.leshow.fan import FanLeshow
-from .integrations.lumi.acpartner import (
-    AirConditioningCompanion,
-    AirConditioningCompanionMcn02,
-    AirConditioningCompanionV3,
-)
-from .integrations.lumi.camera.aqaracamera import AqaraCamera
-from .integrations.lumi.curtain import CurtainMiot
-from .integrations.lumi.gateway import Gateway
-from .integrations.mijia.vacuum import G1Vacuum
-from .integrations.mmgg.petwaterdispenser import PetWaterDispenser
-from .integrations.nwt.dehumidifier import AirDehumidifier
-from .integrations.philips.light import (
-    Ceil,
-    PhilipsBulb,
-    PhilipsEyecare,
-    PhilipsMoonlight,
-    PhilipsRwread,
-    PhilipsWhiteBulb,
-)
-from .integrations.pwzn.relay import PwznRelay
-from .integrations.roborock.vacuum import RoborockVacuum
-from .integrations.roidmi.vacuum import RoidmiVacuumMiot
-from .integrations.scishare.coffee import ScishareCoffee
-from .integrations.shuii.humidifier import AirHumidifierJsq
-from .integrations.tinymu.toiletlid import Toiletlid
-from .integrations.viomi.vacuum import ViomiVacuum
-from .integrations.viomi.viomidishwasher import ViomiDishwasher
-from .integrations.xiaomi.aircondition.airconditioner_miot import AirConditionerMiot
-from .integrations.xiaomi.repeater.wifirepeater import WifiRepeater
-from .integrations.xiaomi.wifispeaker.wifispeaker import WifiSpeaker
-from .integrations.yeelight.dual_switch import YeelightDualControlModule
-from .integrations.yeelight.light import Yeelight
-from .integrations.yunmi.waterpurifier import WaterPurifier, WaterPurifierYunmi
-from .integrations.zhimi.airpurifier import AirFresh, AirPurifier, AirPurifierMiot
-from .integrations.zhimi.fan import Fan, FanZA5
-from .integrations.zhimi.heater import Heater, HeaterMiot
-from .integrations.zhimi.humidifier import AirHumidifier, AirHumidifierMiot
-from .integrations.zimi.powerstrip import PowerStrip
-from .protocol import Message, Utils
-from .push_server import EventInfo, PushServer
-
-from .discovery import Discovery
+_LOGGER = logging.getLogger(__name__)
 
+# Everything else is imported on first access through __getattr__, so that
+# consumers needing a single integration do not pay for loading all of them.
+_LAZY_MODULES = {
+    ".cloud": ("CloudDeviceInfo", "CloudException", "CloudInterface"),
+    ".descriptorcollection": ("DescriptorCollection",),
+    ".descriptors": (
+        "AccessFlags",
+        "ActionDescriptor",
+        "Descriptor",
+        "EnumDescriptor",
+        "PropertyDescriptor",
+        "RangeDescriptor",
+        "ValidSettingRange",
+    ),
+    ".devicefactory": ("DeviceFactory",),
+    ".exceptions": (
+        "DeviceError",
+        "InvalidTokenException",
+        "DeviceException",
+        "UnsupportedFeatureException",
+        "DeviceInfoUnavailableException",
+    ),
+    ".integrations.airdog.airpurifier": ("AirDogX3",),
+    ".integrations.cgllc.airmonitor": (
+        "AirQualityMonitor",
+        "AirQualityMonitorCGDN1",
+    ),
+    ".integrations.chuangmi.camera": ("ChuangmiCamera",),
+    ".integrations.chuangmi.plug": ("ChuangmiPlug",),
+    ".integrations.chuangmi.remote": ("ChuangmiIr",),
+    ".integrations.chunmi.cooker": ("Cooker",),
+    ".integrations.deerma.humidifier": ("AirHumidifierJsqs", "AirHumidifierMjjsq"),
+    ".integrations.dmaker.airfresh": ("AirFreshA1", "AirFreshT2017"),
+    ".integrations.dmaker.fan": ("Fan1C", "FanMiot", "FanP5"),
+    ".integrations.dreame.vacuum": ("DreameVacuum",),
+    ".integrations.genericmiot.genericmiot": ("GenericMiot",),
+    ".integrations.huayi.light": (
+        "Huizuo",
+        "HuizuoLampFan",
+        "HuizuoLampHeater",
+        "HuizuoLampScene",
+    ),
+    ".integrations.ijai.vacuum": ("Pro2Vacuum",),
+    ".integrations.ksmb.walkingpad": ("Walkingpad",),
+    ".integrations.leshow.fan": ("FanLeshow",),
+    ".integrations.lumi.acpartner": (
+        "AirConditioningCompanion",
+        "AirConditioningCompanionMcn02",
+        "AirConditioningCompanionV3",
+    ),
+    ".integrations.lumi.camera.aqaracamera": ("AqaraCamera",),
+    ".integrations.lumi.curtain": ("CurtainMiot",),
+    ".integrations.lumi.gateway": ("Gateway",),
+    ".integrations.mijia.vacuum": ("G1Vacuum",),
+    ".integrations.mmgg.petwaterdispenser": ("PetWaterDispenser",),
+    ".integrations.nwt.dehumidifier": ("AirDehumidifier",),
+    ".integrations.philips.light": (
+        "Ceil",
+        "PhilipsBulb",
+        "PhilipsEyecare",
+        "PhilipsMoonlight",
+        "PhilipsRwread",
+        "PhilipsWhiteBulb",
+    ),
+    ".integrations.pwzn.relay": ("PwznRelay",),
+    ".integrations.roborock.vacuum": ("RoborockVacuum",),
+    ".integrations.roidmi.vacuum": ("RoidmiVacuumMiot",),
+    ".integrations.scishare.coffee": ("ScishareCoffee",),
+    ".integrations.shuii.humidifier": ("AirHumidifierJsq",),
+    ".integrations.tinymu.toiletlid": ("Toiletlid",),
+    ".integrations.viomi.vacuum": ("ViomiVacuum",),
+    ".integrations.viomi.viomidishwasher": ("ViomiDishwasher",),
+    ".integrations.xiaomi.aircondition.airconditioner_miot": ("AirConditionerMiot",),
+    ".integrations.xiaomi.repeater.wifirepeater": ("WifiRepeater",),
+    ".integrations.xiaomi.wifispeaker.wifispeaker": ("WifiSpeaker",),
+    ".integrations.yeelight.dual_switch": ("YeelightDualControlModule",),
+    ".integrations.yeelight.light": ("Yeelight",),
+    ".integrations.yunmi.waterpurifier": ("WaterPurifier", "WaterPurifierYunmi"),
+    ".integrations.zhimi.airpurifier": ("AirFresh", "AirPurifier", "AirPurifierMiot"),
+    ".integrations.zhimi.fan": ("Fan", "FanZA5"),
+    ".integrations.zhimi.heater": ("Heater", "HeaterMiot"),
+    ".integrations.zhimi.humidifier": ("AirHumidifier", "AirHumidifierMiot"),
+    ".integrations.zimi.powerstrip": ("PowerStrip",),
+    ".protocol": ("Message", "Utils"),
+    ".push_server": ("EventInfo", "PushServer"),
+    ".discovery": ("Discovery",),
+}
 
-def __getattr__(name):
-    """Create deprecation warnings on classes that are going away."""
-    from warnings import warn
+_LAZY_IMPORTS = {
+    name: module for module, names in _LAZY_MODULES.items() for name in names
+}
+
+__all__ = [
+    "Device",
+    "DeviceStatus",
+    "MiotDevice",
+    "DeviceInfo",
+    *_LAZY_IMPORTS,
+]
+
+
+_integrations_loaded = False
+
+
+def _load_integrations():
+    """Import all integration modules so that they register themselves."""
+    global _integrations_loaded
+    if _integrations_loaded:
+        return
+
+    for module in _LAZY_MODULES:
+        if not module.startswith(".integrations."):
+            continue
+        # A single broken integration should not hide all the others
+        try:
+            importlib.import_module(module, __name__)
+        except ImportError as ex:
+            _LOGGER.warning("Unable to load integration %s: %s", module, ex)
+    _integrations_loaded = True
 
-    current_globals = globals()
 
-    def _is_miio_integration(x):
-        """Return True if miio.integrations is in the module 'path'."""
-        module_ = current_globals[x]
-        if "miio.integrations" in str(module_):
-            return True
+def _is_miio_integration(obj):
+    """Return True if the object is or lives in the miio.integrations package."""
+    name = getattr(obj, "__module__", None) or getattr(obj, "__name__", "")
+    return isinstance(name, str) and name.startswith(f"{__name__}.integrations")
 
-        return False
 
-    deprecated_module_mapping = {
-        str(x): current_globals[x] for x in current_globals if _is_miio_integration(x)
+@cache
+def _get_deprecated_module_mapping():
+    """Return the deprecated names mapping, building it on first use."""
+    return {
+        str(name): obj for name, obj in globals().items() if _is_miio_integration(obj)
     }
-    if new_module := deprecated_module_mapping.get(name):
-        warn(
+
+
+def __getattr__(name):
+    """Import public names lazily and warn on classes that are going away."""
+    if module := _LAZY_IMPORTS.get(name):
+        obj = getattr(importlib.import_module(module, __name__), name)
+        globals()[name] = obj
+        return obj
+
+    if name == "__version__":
+        from importlib.metadata import PackageNotFoundError, version  # type: ignore
+
+        try:
+            version_ = version("python-miio")
+        except PackageNotFoundError as ex:
+            # Vendored copies are not installed as a distribution
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from ex
+        globals()[name] = version_
+        return version_
+
+    if new_module := _get_deprecated_module_mapping().get(name):
+        warnings.warn(
             f"Importing {name} directly from 'miio' is deprecated, import {new_module} or use DeviceFactory.create() instead",
             DeprecationWarning,
         )
@@ -124,4 +184,5 @@ def __getattr__(name):
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-__version__ = version("python-miio")
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,7 +3,7 @@ from typing import Any, Dict
 
 import click
 
-from . import Discovery
+from . import Discovery, _load_integrations
 from .click_common import (
     DeviceGroupMeta,
     ExceptionHandlerGroup,
@@ -55,6 +55,7 @@ def cli(ctx, debug: int, output: str):
     ctx.obj = GlobalContextObject(debug=debug, output=output_func)
 
 
+_load_integrations()
 for device_class in DeviceGroupMeta._device_classes:
     cli.add_command(device_class.get_device_group())
 
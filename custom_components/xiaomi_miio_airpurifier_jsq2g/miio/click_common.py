@@ -9,7 +9,18 @@ import json
 import logging
 import re
 from functools import partial, wraps
-from typing import Any, Callable, ClassVar, Dict, List, Optional, Set, Type, Union
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Type,
+    Union,
+)
 
 import click
 
@@ -113,7 +124,7 @@ class GlobalContextObject:
 class DeviceGroupMeta(type):
     _device_classes: Set[Type] = set()
     _supported_models: ClassVar[List[str]]
-    _mappings: ClassVar[Dict[str, Any]]
+    _mappings: ClassVar[Mapping[str, Any]]
 
     def __new__(mcs, name, bases, namespace):
         commands = {}
@@ -1,6 +1,6 @@
 import logging
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union, cast, final  # noqa: F401
+from typing import Any, Dict, List, Mapping, Optional, Union, cast, final  # noqa: F401
 
 import click
 
@@ -36,7 +36,7 @@ class Device(metaclass=DeviceGroupMeta):
 
     retry_count = 3
     timeout = 5
-    _mappings: Dict[str, Any] = {}
+    _mappings: Mapping[str, Any] = {}
     _supported_models: List[str] = []
 
     def __init_subclass__(cls, **kwargs):
@@ -47,16 +47,25 @@ class DeviceFactory:
     def supported_models(cls) -> Dict[str, Type[Device]]:
         """Return a dictionary of models and their corresponding implementation
         classes."""
+        from . import _load_integrations
+
+        _load_integrations()
         return cls._supported_models
 
     @classmethod
     def integrations(cls) -> List[Type[Device]]:
         """Return the list of integration classes."""
+        from . import _load_integrations
+
+        _load_integrations()
         return cls._integration_classes
 
     @classmethod
     def class_for_model(cls, model: str):
         """Return implementation class for the given model, if available."""
+        from . import _load_integrations
+
+        _load_integrations()
         if model in cls._supported_models:
             return cls._supported_models[model]
 
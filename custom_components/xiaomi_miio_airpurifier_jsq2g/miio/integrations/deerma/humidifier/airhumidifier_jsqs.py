@@ -1,66 +1,104 @@
 import enum
+import inspect
 import logging
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Optional, TypedDict, cast
 
 import click
 
 from ....click_common import EnumType, command, format_output
-from ....miot_device import DeviceStatus, MiotDevice
+from ....miot_device import DeviceStatus, MiotDevice, MiotMapping
 
 _LOGGER = logging.getLogger(__name__)
-_MAPPING = {
-    # Source https://miot-spec.org/miot-spec-v2/instance?type=urn:miot-spec-v2:device:humidifier:0000A00E:deerma-jsqs:2
-    # Air Humidifier (siid=2)
-    "power": {"siid": 2, "piid": 1},  # bool
-    "fault": {"siid": 2, "piid": 2},  # 0 - No Faults, 1 - Insufficient Water, 2 - Water Separation
-    "fan_level": {"siid": 2, "piid": 5},  # 1 - lvl1, 2 - lvl2, 3 - lvl3, 4 - auto
-    "target_humidity": {"siid": 2, "piid": 6},  # [40, 80] step 1
-    "status": {"siid": 2, "piid": 7},  # 1 - Idle, 2 - Busy
-    "mode": {"siid": 2, "piid": 8},  # 0 - None, 1 - Constant Humidity
-    # Environment (siid=3)
-    "relative_humidity": {"siid": 3, "piid": 1},  # [0, 100] step 1
-    "temperature": {"siid": 3, "piid": 7},  # [-30, 100] step 1
-    # Alarm (siid=5)
-    "buzzer": {"siid": 5, "piid": 1},  # bool
-    # Light (siid=6)
-    "led_light": {"siid": 6, "piid": 1},  # bool
-    # Other (siid=7)
-    "tank_filed": {"siid": 7, "piid": 1},  # bool
-    "water_shortage_fault": {"siid": 7, "piid": 2},  # bool
-    "humi_sensor_fault": {"siid": 7, "piid": 3},  # bool
-    "temp_sensor_fault": {"siid": 7, "piid": 4},  # bool
-    "overwet_protect": {"siid": 7, "piid": 5},  # bool
-    "overwet_protect_on": {"siid": 7, "piid": 6},  # bool
-    "overtop_humidity": {"siid": 7, "piid": 7},  # bool
-    "overtop_humidity": {"siid": 7, "piid": 8},  # bool
-}
+_MAPPING = MappingProxyType(
+    {
+        did: MappingProxyType(ids)
+        for did, ids in {
+            # Source https://miot-spec.org/miot-spec-v2/instance?type=urn:miot-spec-v2:device:humidifier:0000A00E:deerma-jsqs:2
+            # Air Humidifier (siid=2)
+            "power": {"siid": 2, "piid": 1},  # bool
+            "fault": {"siid": 2, "piid": 2},  # 0 - No Faults, 1 - Insufficient Water, 2 - Water Separation
+            "fan_level": {"siid": 2, "piid": 5},  # 1 - lvl1, 2 - lvl2, 3 - lvl3, 4 - auto
+            "target_humidity": {"siid": 2, "piid": 6},  # [40, 80] step 1
+            "status": {"siid": 2, "piid": 7},  # 1 - Idle, 2 - Busy
+            "mode": {"siid": 2, "piid": 8},  # 0 - None, 1 - Constant Humidity
+            # Environment (siid=3)
+            "relative_humidity": {"siid": 3, "piid": 1},  # [0, 100] step 1
+            "temperature": {"siid": 3, "piid": 7},  # [-30, 100] step 1
+            # Alarm (siid=5)
+            "buzzer": {"siid": 5, "piid": 1},  # bool
+            # Light (siid=6)
+            "led_light": {"siid": 6, "piid": 1},  # bool
+            # Other (siid=7)
+            "tank_filed": {"siid": 7, "piid": 1},  # bool
+            "water_shortage_fault": {"siid": 7, "piid": 2},  # bool
+            "humi_sensor_fault": {"siid": 7, "piid": 3},  # bool
+            "temp_sensor_fault": {"siid": 7, "piid": 4},  # bool
+            "overwet_protect": {"siid": 7, "piid": 5},  # bool
+            "overwet_protect_on": {"siid": 7, "piid": 6},  # bool
+            "overtop_humidity": {"siid": 7, "piid": 7},  # bool
+            "overtop_humidity_alarm": {"siid": 7, "piid": 8},  # bool
+        }.items()
+    }
+)
 
 SUPPORTED_MODELS = [
     "deerma.humidifier.jsq2w",
     "deerma.humidifier.jsq2g",
 ]
-MIOT_MAPPING = {model: _MAPPING for model in SUPPORTED_MODELS}
+MIOT_MAPPING = MappingProxyType({model: _MAPPING for model in SUPPORTED_MODELS})
 
 
-class OperationMode(enum.Enum):
+class OperationMode(enum.IntEnum):
     Low = 1
     Mid = 2
     High = 3
     Auto = 4
 
 
+class _StatusData(TypedDict, total=False):
+    """Shape of the status payload, keyed by the names in _MAPPING.
+
+    This documents the payload for readers and for callers building one by
+    hand; status() casts its runtime-built dict to it.
+
+    Values are None when the device fails to report the property.
+    """
+
+    power: Optional[bool]
+    fault: Optional[int]
+    fan_level: Optional[int]
+    target_humidity: Optional[int]
+    status: Optional[int]
+    mode: Optional[int]
+    relative_humidity: Optional[int]
+    temperature: Optional[float]
+    buzzer: Optional[bool]
+    led_light: Optional[bool]
+    tank_filed: Optional[bool]
+    water_shortage_fault: Optional[bool]
+    humi_sensor_fault: Optional[bool]
+    temp_sensor_fault: Optional[bool]
+    overwet_protect: Optional[bool]
+    overwet_protect_on: Optional[bool]
+    overtop_humidity: Optional[bool]
+    overtop_humidity_alarm: Optional[bool]
+
+
 class AirHumidifierJsqsStatus(DeviceStatus):
-    
+    """Container for status reports from the air humidifier."""
 
-    def __init__(self, data: Dict[str, Any]) -> None:
+    _FAN_LEVELS: Dict[Optional[int], OperationMode] = {mode.value: mode for mode in OperationMode}
+
+    def __init__(self, data: _StatusData) -> None:
         self.data = data
 
     # Air Humidifier
 
     @property
-    def is_on(self) -> bool:
+    def is_on(self) -> Optional[bool]:
         """Return True if device is on."""
-        return self.data["power"]
+        return self.data.get("power")
 
     @property
     def power(self) -> str:
@@ -68,18 +106,17 @@ class AirHumidifierJsqsStatus(DeviceStatus):
         return "on" if self.is_on else "off"
 
     @property
-    def error(self) -> int:
+    def error(self) -> Optional[int]:
         """Return error state."""
-        return self.data["fault"]
+        return self.data.get("fault")
 
     @property
     def fan_level(self) -> OperationMode:
         """Return current operation fan level."""
-
-        try:
-            fan_level = OperationMode(self.data["fan_level"])
-        except ValueError as e:
-            _LOGGER.exception("Cannot parse fan level: %s", e)
+        value = self.data.get("fan_level")
+        fan_level = self._FAN_LEVELS.get(value)
+        if fan_level is None:
+            _LOGGER.debug("Unknown fan level: %s", value)
             return OperationMode.Auto
 
         return fan_level
@@ -144,6 +181,10 @@ class AirHumidifierJsqsStatus(DeviceStatus):
     @property
     def overtop_humidity(self) -> Optional[bool]:
         return self.data.get("overtop_humidity") 
+
+    @property
+    def overtop_humidity_alarm(self) -> Optional[bool]:
+        return self.data.get("overtop_humidity_alarm")
     
     @property
     def temp_sensor_fault(self) -> Optional[bool]:
@@ -151,34 +192,84 @@ class AirHumidifierJsqsStatus(DeviceStatus):
     
 
 
+def _bool_setting_command(name: str, arg_name: str, property_key: str, label: str):
+    """Create a command method turning the boolean ``property_key`` on or off.
+
+    The method takes a single ``arg_name`` argument, which is also the name of
+    the click argument, so that it can be passed by keyword like a handwritten
+    setter. It has to be created inside the class body, as the commands are
+    collected by the device metaclass when the class is created.
+    """
+    signature = inspect.Signature(
+        [
+            inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD),
+            inspect.Parameter(
+                arg_name, inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=bool
+            ),
+        ]
+    )
+
+    def setter(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        return bound.arguments["self"].set_property(
+            property_key, bound.arguments[arg_name]
+        )
+
+    setter.__name__ = name
+    setter.__doc__ = f"Set {label} on/off."
+    setter.__signature__ = signature  # type: ignore[attr-defined]
+
+    return command(
+        click.argument(arg_name, type=bool),
+        default_output=format_output(
+            lambda **kwargs: f"Turning {'on' if kwargs[arg_name] else 'off'} {label}"
+        ),
+    )(setter)
+
+
 class AirHumidifierJsqs(MiotDevice):
     """Main class representing the air humidifier which uses MIoT protocol."""
 
     _mappings = MIOT_MAPPING
 
+    def _get_mapping(self) -> MiotMapping:
+        """Return the mapping shared by all supported models.
+
+        This skips the per-call model lookup, which may need to query the device
+        info if the model was not given.
+        """
+        return _MAPPING
+
     @command(
         default_output=format_output(
             "",
-            "Power: {result.power}\n"
-            "Error: {result.error}\n"
-            "Target Humidity: {result.target_humidity} %\n"
-            "Relative Humidity: {result.relative_humidity} %\n"
-            "Temperature: {result.temperature} °C\n"
-            "Water tank detached: {result.tank_filed}\n"
-            "Mode: {result.mode}\n"
-            "LED light: {result.led_light}\n"
-            "Buzzer: {result.buzzer}\n"
-            "Overwet protection: {result.overwet_protect}\n",
+            lambda result: (
+                f"Power: {result.power}\n"
+                f"Error: {result.error}\n"
+                f"Target Humidity: {result.target_humidity} %\n"
+                f"Relative Humidity: {result.relative_humidity} %\n"
+                f"Temperature: {result.temperature} °C\n"
+                f"Water tank detached: {result.tank_filed}\n"
+                f"Fan level: {result.fan_level}\n"
+                f"LED light: {result.led_light}\n"
+                f"Buzzer: {result.buzzer}\n"
+                f"Overwet protection: {result.overwet_protect}\n"
+            ),
         )
     )
     def status(self) -> AirHumidifierJsqsStatus:
         """Retrieve properties."""
 
+        # The keys come from the did values of the response, which are the
+        # _MAPPING keys, so this cannot be checked statically.
         return AirHumidifierJsqsStatus(
-            {
-                prop["did"]: prop["value"] if prop["code"] == 0 else None
-                for prop in self.get_properties_for_mapping()
-            }
+            cast(
+                _StatusData,
+                {
+                    prop["did"]: prop["value"] if prop["code"] == 0 else None
+                    for prop in self.get_properties_for_mapping()
+                },
+            )
         )
 
     @command(default_output=format_output("Powering on"))
@@ -197,57 +288,28 @@ class AirHumidifierJsqs(MiotDevice):
     )
     def set_target_humidity(self, humidity: int):
         """Set target humidity."""
-        if humidity <= 40 or humidity >= 70:
+        if not 40 <= humidity <= 80:
             raise ValueError(
-                "Invalid target humidity: %s. Must be between 40 and 70" % humidity
+                f"Invalid target humidity: {humidity}. Must be between 40 and 80"
             )
         return self.set_property("target_humidity", humidity)
 
     @command(
         click.argument("fan_level", type=EnumType(OperationMode)),
-        default_output=format_output("Setting fan_level to '{mode.value}'"),
+        default_output=format_output("Setting fan_level to '{fan_level.value}'"),
     )
     def set_fan_level(self, fan_level: OperationMode):
         """Set working fan_level."""
-        return self.set_property("fan_level", fan_level.value)
-
-    @command(
-        click.argument("light", type=bool),
-        default_output=format_output(
-            lambda light: "Turning on LED light" if light else "Turning off LED light"
-        ),
-    )
-    def set_light(self, light: bool):
-        """Set led light."""
-        return self.set_property("led_light", light)
-
-    @command(
-        click.argument("buzzer", type=bool),
-        default_output=format_output(
-            lambda buzzer: "Turning on buzzer" if buzzer else "Turning off buzzer"
-        ),
-    )
-    def set_buzzer(self, buzzer: bool):
-        """Set buzzer on/off."""
-        return self.set_property("buzzer", buzzer)
+        return self.set_property("fan_level", fan_level)
 
-    @command(
-        click.argument("overwet", type=bool),
-        default_output=format_output(
-            lambda overwet: "Turning on overwet" if overwet else "Turning off overwet"
-        ),
+    set_light = _bool_setting_command("set_light", "light", "led_light", "LED light")
+    set_buzzer = _bool_setting_command("set_buzzer", "buzzer", "buzzer", "buzzer")
+    set_overwet_protect = _bool_setting_command(
+        "set_overwet_protect", "overwet", "overwet_protect", "overwet"
     )
-    def set_overwet_protect(self, overwet: bool):
-        """Set overwet mode on/off."""
-        return self.set_property("overwet_protect", overwet)
-    
-    
-
-    @command(
-        click.argument("overwet_protect_on", type=bool),
-        default_output=format_output(
-            lambda overwet: "Turning on overwet_protect_on" if overwet else "Turning off overwet_protect_on"
-        ),
+    set_overwet_protect_on = _bool_setting_command(
+        "set_overwet_protect_on",
+        "overwet_protect_on",
+        "overwet_protect_on",
+        "overwet_protect_on",
     )
-    def set_overwet_protect_on(self, overwet_protect_on: bool):
-        return self.set_property("overwet_protect_on", overwet_protect_on)
@@ -3,12 +3,12 @@ import pytest
 from miio import AirHumidifierJsqs
 from miio.tests.dummies import DummyMiotDevice
 
-from ..airhumidifier_jsqs import OperationMode
+from ..airhumidifier_jsqs import _MAPPING, AirHumidifierJsqsStatus, OperationMode
 
 _INITIAL_STATE = {
     "power": True,
     "fault": 0,
-    "mode": 4,
+    "fan_level": 4,
     "target_humidity": 60,
     "temperature": 21.6,
     "relative_humidity": 62,
@@ -17,6 +17,8 @@ _INITIAL_STATE = {
     "water_shortage_fault": False,
     "tank_filed": False,
     "overwet_protect": True,
+    "overtop_humidity": False,
+    "overtop_humidity_alarm": False,
 }
 
 
@@ -40,6 +42,14 @@ def dev(request):
     yield DummyAirHumidifierJsqs()
 
 
+def test_mapping_is_read_only():
+    with pytest.raises(TypeError):
+        _MAPPING["power"] = {"siid": 2, "piid": 2}
+
+    with pytest.raises(TypeError):
+        _MAPPING["power"]["siid"] = 3
+
+
 def test_on(dev):
     dev.off()  # ensure off
     assert dev.status().is_on is False
@@ -60,7 +70,7 @@ def test_status(dev):
     status = dev.status()
     assert status.is_on is _INITIAL_STATE["power"]
     assert status.error == _INITIAL_STATE["fault"]
-    assert status.mode == OperationMode(_INITIAL_STATE["mode"])
+    assert status.fan_level == OperationMode(_INITIAL_STATE["fan_level"])
     assert status.target_humidity == _INITIAL_STATE["target_humidity"]
     assert status.temperature == _INITIAL_STATE["temperature"]
     assert status.relative_humidity == _INITIAL_STATE["relative_humidity"]
@@ -69,6 +79,20 @@ def test_status(dev):
     assert status.water_shortage_fault == _INITIAL_STATE["water_shortage_fault"]
     assert status.tank_filed == _INITIAL_STATE["tank_filed"]
     assert status.overwet_protect == _INITIAL_STATE["overwet_protect"]
+    assert status.overtop_humidity == _INITIAL_STATE["overtop_humidity"]
+    assert status.overtop_humidity_alarm == _INITIAL_STATE["overtop_humidity_alarm"]
+
+
+def test_status_unsupported_property(dev, monkeypatch):
+    response = [
+        {"did": "power", "siid": 2, "piid": 1, "code": 0, "value": True},
+        {"did": "overtop_humidity", "siid": 7, "piid": 7, "code": -4003},
+    ]
+    monkeypatch.setattr(dev, "get_properties_for_mapping", lambda: response)
+
+    status = dev.status()
+    assert status.is_on is True
+    assert status.overtop_humidity is None
 
 
 def test_set_target_humidity(dev):
@@ -87,21 +111,19 @@ def test_set_target_humidity(dev):
         dev.set_target_humidity(81)
 
 
-def test_set_mode(dev):
-    def mode():
-        return dev.status().mode
-
-    dev.set_mode(OperationMode.Auto)
-    assert mode() == OperationMode.Auto
+@pytest.mark.parametrize("fan_level", [7, None])
+def test_unknown_fan_level(fan_level):
+    status = AirHumidifierJsqsStatus({"fan_level": fan_level})
+    assert status.fan_level == OperationMode.Auto
 
-    dev.set_mode(OperationMode.Low)
-    assert mode() == OperationMode.Low
 
-    dev.set_mode(OperationMode.Mid)
-    assert mode() == OperationMode.Mid
+def test_set_fan_level(dev):
+    def fan_level():
+        return dev.status().fan_level
 
-    dev.set_mode(OperationMode.High)
-    assert mode() == OperationMode.High
+    for level in OperationMode:
+        dev.set_fan_level(level)
+        assert fan_level() == level
 
 
 def test_set_led_light(dev):
@@ -114,6 +136,9 @@ def test_set_led_light(dev):
     dev.set_light(False)
     assert led_light() is False
 
+    dev.set_light(light=True)
+    assert led_light() is True
+
 
 def test_set_buzzer(dev):
     def buzzer():
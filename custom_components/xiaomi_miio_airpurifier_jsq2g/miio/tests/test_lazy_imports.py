@@ -0,0 +1,50 @@
+import importlib
+
+import pytest
+
+import miio
+from miio import DeviceFactory
+
+# GenericMiot imports the micloud package that sits next to miio in the
+# vendored layout, which is out of reach when miio is a top-level package.
+_VENDORED_ONLY = {"GenericMiot"}
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        pytest.param(
+            name,
+            marks=pytest.mark.skipif(
+                miio.__name__ == "miio" and name in _VENDORED_ONLY,
+                reason="requires the vendored package layout",
+            ),
+        )
+        for name in sorted(miio._LAZY_IMPORTS)
+    ],
+)
+def test_lazy_imports_resolve(name):
+    module = importlib.import_module(miio._LAZY_IMPORTS[name], "miio")
+    assert getattr(miio, name) is getattr(module, name)
+
+
+def test_factory_finds_lazily_imported_integration():
+    # Look up first, so the registration does not come from the import below
+    cls = DeviceFactory.class_for_model("deerma.humidifier.jsq2g")
+
+    from miio.integrations.deerma.humidifier import AirHumidifierJsqs
+
+    assert cls is AirHumidifierJsqs
+
+
+def test_version_without_distribution(monkeypatch):
+    from importlib import metadata
+
+    def _not_found(name):
+        raise metadata.PackageNotFoundError(name)
+
+    monkeypatch.setattr(metadata, "version", _not_found)
+    monkeypatch.delitem(vars(miio), "__version__", raising=False)
+
+    assert getattr(miio, "__version__", None) is None
+    assert not hasattr(miio, "__version__")